@@ -1,39 +1,129 @@
+import asyncio
+import codecs
 import sqlite3
-import requests
+import time
+import aiohttp
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from queue import Queue
 from fastapi import FastAPI, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import HTMLResponse
-from contextlib import asynccontextmanager
-from bs4 import BeautifulSoup
+from contextlib import asynccontextmanager, suppress
+from html import escape
+from cssselect import GenericTranslator
+from lxml import etree
 from typing import Optional
 
 # Database configuration
 DATABASE_FILE = "textures.db"
 
+# An index whose newest row is younger than this (in seconds) is not re-crawled on startup
+CRAWL_TTL = 24 * 60 * 60
+
+# Number of read connections pooled for request handlers
+POOL_SIZE = 8
+
+# Pragmas applied to every pooled read connection
+CONNECTION_PRAGMAS = """
+    PRAGMA journal_mode=WAL;
+    PRAGMA synchronous=NORMAL;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA cache_size=-64000;
+    PRAGMA mmap_size=268435456;
+"""
+
+# Size of the chunks streamed from each listing page into the parser
+CHUNK_SIZE = 16384
+
+# Maximum number of listing pages fetched at once across all sources
+CRAWL_CONCURRENCY = 8
+
+# Maximum number of rows shown on the results page
+RESULTS_LIMIT = 50
+
+# FTS hits are materialized in a CTE before joining back to textures, so
+# extra predicates such as a source filter can't push the planner off the
+# full-text index.
+SEARCH_QUERY = """
+    WITH hits AS (
+        SELECT rowid, rank FROM textures_fts WHERE textures_fts MATCH ? ORDER BY rank LIMIT ?
+    )
+    SELECT t.title, t.url, t.source FROM hits JOIN textures t ON t.id = hits.rowid
+    ORDER BY hits.rank
+"""
+SEARCH_BY_SOURCE_QUERY = """
+    WITH hits AS (
+        SELECT rowid, rank FROM textures_fts WHERE textures_fts MATCH ? ORDER BY rank LIMIT ?
+    )
+    SELECT t.title, t.url, t.source FROM hits JOIN textures t ON t.id = hits.rowid
+    WHERE t.source = ?
+    ORDER BY hits.rank
+    LIMIT ?
+"""
+
+# A crawlable listing page. selector must match <a> elements, since pages are
+# streamed through a parser that only reports anchors. title_sel picks the
+# element holding the title inside each matched item; None means the item's
+# own title attribute is used. max_pages is how many '?page=N' listing pages
+# are crawled; keep it at 1 until a source is confirmed to paginate that way.
+# is_item and find_title are the compiled XPath forms of selector and title_sel.
+Source = namedtuple('Source', 'name url selector title_sel url_prefix max_pages is_item find_title')
+
+def compile_source(name, url, selector, title_sel, url_prefix, max_pages=1):
+    """Builds a Source with its CSS selectors compiled to XPath once, at import time."""
+    translator = GenericTranslator()
+    is_item = etree.XPath(translator.css_to_xpath(selector, prefix='self::'))
+    find_title = etree.XPath(translator.css_to_xpath(title_sel)) if title_sel else None
+    return Source(name, url, selector, title_sel, url_prefix, max_pages, is_item, find_title)
+
+def page_url(source, page):
+    """Returns the URL of a source's listing page; page 1 is the bare listing URL."""
+    return source.url if page == 1 else f"{source.url}?page={page}"
+
 # List of sources to crawl with specific selectors
 SOURCES = [
-    {
-        "url": "https://ambientcg.com/list",
-        "name": "AmbientCG",
-        "selector": 'a[href^="/textures/"]',
-        "get_title": lambda item: item.find('h3').get_text(strip=True),
-        "get_url": lambda item: f"https://ambientcg.com{item.get('href')}"
-    },
-    {
-        "url": "https://polyhaven.com/textures",
-        "name": "Poly Haven",
-        "selector": 'a.tile-link.tile-link__textures',
-        "get_title": lambda item: item.find('h2').get_text(strip=True),
-        "get_url": lambda item: f"https://polyhaven.com{item.get('href')}"
-    },
-    {
-        "url": "https://www.textures.com/browse/pbr-materials/114511",
-        "name": "Textures.com (PBR)",
-        "selector": 'a.item-link',
-        "get_title": lambda item: item.get('title'),
-        "get_url": lambda item: f"https://www.textures.com{item.get('href')}"
-    }
+    compile_source('AmbientCG', 'https://ambientcg.com/list', 'a[href^="/textures/"]', 'h3', 'https://ambientcg.com'),
+    compile_source('Poly Haven', 'https://polyhaven.com/textures', 'a.tile-link.tile-link__textures', 'h2', 'https://polyhaven.com'),
+    compile_source('Textures.com (PBR)', 'https://www.textures.com/browse/pbr-materials/114511', 'a.item-link', None, 'https://www.textures.com'),
 ]
 
+# Static page shell, split around the search value, heading and results so
+# each request only concatenates the dynamic parts.
+TEMPLATE_HEAD = '''<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Texture Search Engine</title>
+    <script src="https://cdn.tailwindcss.com"></script>
+    <link rel="preconnect" href="https://fonts.googleapis.com">
+    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
+    <link href="https://fonts.googleapis.com/css2?family=Inter:wght@400;700&display=swap" rel="stylesheet">
+    <style>
+        body {
+            font-family: 'Inter', sans-serif;
+            background-color: #f3f4f6;
+        }
+    </style>
+</head>
+<body class="bg-gray-100 flex items-center justify-center min-h-screen p-4">
+    <div class="bg-white rounded-xl shadow-lg p-8 w-full max-w-2xl">
+        <h1 class="text-3xl font-bold text-gray-800 mb-6 text-center">Design Resource Search</h1>
+        <form action="/" method="get" class="flex flex-col sm:flex-row gap-4 mb-8">
+            <input type="text" name="q" placeholder="Search for textures, materials..." class="flex-1 p-3 rounded-lg border-2 border-gray-300 focus:outline-none focus:border-blue-500 transition-colors" value="'''
+TEMPLATE_MID = """">
+            <button type="submit" class="bg-blue-600 text-white font-semibold py-3 px-6 rounded-lg hover:bg-blue-700 transition-colors shadow-md">Search</button>
+        </form>
+        <h2 class="text-2xl font-semibold text-gray-700 mb-4">"""
+TEMPLATE_RESULTS = """</h2>
+        """
+TEMPLATE_TAIL = """
+    </div>
+</body>
+</html>
+"""
+
 def setup_database():
     """Initializes the SQLite database and table."""
     conn = sqlite3.connect(DATABASE_FILE)
@@ -43,162 +133,364 @@ def setup_database():
             id INTEGER PRIMARY KEY,
             title TEXT NOT NULL,
             url TEXT NOT NULL UNIQUE,
-            source TEXT NOT NULL
+            source TEXT NOT NULL,
+            crawled_at INTEGER
+        )
+    """)
+    columns = [row[1] for row in cursor.execute("PRAGMA table_info(textures)")]
+    if 'crawled_at' not in columns:
+        # Databases created before crawl timestamps were recorded.
+        cursor.execute("ALTER TABLE textures ADD COLUMN crawled_at INTEGER")
+
+    # crawled_at records when a row was first indexed; the time the last crawl
+    # finished is kept separately in this single-row table.
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS crawl_meta (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            last_crawled_at INTEGER NOT NULL
         )
     """)
+
+    # Full-text index over titles, kept in sync with the textures table by triggers.
+    fts_sql = cursor.execute(
+        "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'textures_fts'"
+    ).fetchone()
+    if fts_sql and 'prefix=' not in fts_sql[0]:
+        # Indexes created before prefix indexes were added are rebuilt below.
+        cursor.execute("DROP TABLE textures_fts")
+        fts_sql = None
+    cursor.executescript("""
+        CREATE VIRTUAL TABLE IF NOT EXISTS textures_fts USING fts5(
+            title,
+            url UNINDEXED,
+            source UNINDEXED,
+            content='textures',
+            content_rowid='id',
+            tokenize='unicode61 remove_diacritics 2',
+            prefix='2 3 4'
+        );
+        CREATE TRIGGER IF NOT EXISTS textures_ai AFTER INSERT ON textures BEGIN
+            INSERT INTO textures_fts(rowid, title, url, source)
+            VALUES (new.id, new.title, new.url, new.source);
+        END;
+        CREATE TRIGGER IF NOT EXISTS textures_ad AFTER DELETE ON textures BEGIN
+            INSERT INTO textures_fts(textures_fts, rowid, title, url, source)
+            VALUES ('delete', old.id, old.title, old.url, old.source);
+        END;
+        CREATE TRIGGER IF NOT EXISTS textures_au AFTER UPDATE ON textures BEGIN
+            INSERT INTO textures_fts(textures_fts, rowid, title, url, source)
+            VALUES ('delete', old.id, old.title, old.url, old.source);
+            INSERT INTO textures_fts(rowid, title, url, source)
+            VALUES (new.id, new.title, new.url, new.source);
+        END;
+    """)
+    if not fts_sql:
+        # Index any rows that were crawled before the FTS table existed.
+        cursor.execute("INSERT INTO textures_fts(textures_fts) VALUES ('rebuild')")
     conn.commit()
     conn.close()
 
-def crawl_and_index_all_sources():
-    """Crawls all defined sources and populates the database with detailed logging."""
-    print("Starting the crawling and indexing process for all sources...")
-    
-    conn = sqlite3.connect(DATABASE_FILE)
-    cursor = conn.cursor()
-    
-    total_added = 0
-    for source in SOURCES:
-        url = source['url']
-        source_name = source['name']
-        selector = source['selector']
-        get_title = source['get_title']
-        get_url = source['get_url']
-        
-        print(f"\n--- Crawling {source_name} ---")
+def open_connection():
+    """Opens a WAL-mode read connection for the request handler pool."""
+    conn = sqlite3.connect(
+        DATABASE_FILE, check_same_thread=False, isolation_level=None, cached_statements=256
+    )
+    conn.row_factory = sqlite3.Row
+    conn.executescript(CONNECTION_PRAGMAS)
+    return conn
+
+def index_is_stale(conn):
+    """Returns True when the index is empty or was last crawled more than CRAWL_TTL ago."""
+    count, last_crawled = conn.execute(
+        "SELECT (SELECT COUNT(*) FROM textures), (SELECT last_crawled_at FROM crawl_meta WHERE id = 1)"
+    ).fetchone()
+    return count == 0 or last_crawled is None or time.time() - last_crawled >= CRAWL_TTL
+
+def open_pool():
+    """Opens POOL_SIZE connections; each is used by one thread at a time."""
+    pool = Queue()
+    for _ in range(POOL_SIZE):
+        pool.put(open_connection())
+    return pool
+
+def close_pool(pool):
+    """Closes every connection in the pool."""
+    while not pool.empty():
+        pool.get_nowait().close()
+
+def run_pooled(pool, fn, *args):
+    """
+    Calls fn with a connection borrowed from the pool and returns it afterwards.
+    Meant to be called via run_in_threadpool, so waiting for a free connection
+    never blocks the event loop.
+    """
+    conn = pool.get()
+    try:
+        return fn(conn, *args)
+    finally:
+        pool.put(conn)
+
+def fetch_all(conn, query, params=()):
+    """Runs a query and returns every row; meant to be called via run_in_threadpool."""
+    return conn.execute(query, params).fetchall()
+
+def render_results(conn, query, params=()):
+    """
+    Runs a title/url/source query and renders its rows as the results list,
+    or returns an empty string when nothing matched. Rows are streamed from the
+    cursor and crawled values are HTML-escaped. Meant to be called via run_in_threadpool.
+    """
+    parts = [
+        f"<li><a href='{escape(r['url'])}' target='_blank' class='text-blue-500 hover:underline'>{escape(r['title'])}</a> <span class='text-xs text-gray-500'>({escape(r['source'])})</span></li>"
+        for r in conn.execute(query, params)
+    ]
+    if not parts:
+        return ""
+    return "<ul class='list-disc pl-5 mt-4 space-y-2'>" + "".join(parts) + "</ul>"
+
+def to_fts_query(q):
+    """
+    Turns raw user input into an FTS5 query matching every word as a prefix,
+    e.g. 'red bri' -> '"red"* "bri"*'. Words are quoted so punctuation can't
+    break the query syntax. Returns an empty string when q has no words.
+    """
+    return ' '.join('"' + token.replace('"', '""') + '"*' for token in q.split())
+
+def parse_chunk(parser, chunk, source):
+    """
+    Feeds one chunk to the pull parser and returns rows for the anchors it completed.
+    A chunk of None closes the parser and flushes whatever is left.
+    """
+    if chunk is None:
+        parser.close()
+    else:
+        parser.feed(chunk)
+
+    rows = []
+    for _, element in parser.read_events():
+        if source.is_item(element):
+            if source.find_title:
+                title_nodes = source.find_title(element)
+                title = ''.join(title_nodes[0].itertext()).strip() if title_nodes else None
+            else:
+                title = element.get('title')
+            href = element.get('href')
+
+            if title and href:
+                rows.append((title, source.url_prefix + href, source.name))
+        # Release the anchor's subtree now that it has been read, then drop
+        # everything that precedes it (earlier siblings of the anchor and of
+        # each ancestor), which the parser has already finished with.
+        element.clear()
+        node = element
+        while node.getparent() is not None:
+            parent = node.getparent()
+            while node.getprevious() is not None:
+                del parent[0]
+            node = parent
+    return rows
+
+def new_parser(charset):
+    """
+    Creates the pull parser for one listing page, reporting only <a> end events.
+    The header charset is tried as given and in Python's normalised spelling
+    (lxml rejects e.g. 'latin-1' but accepts 'iso8859-1'). Without a charset lxml
+    knows, it detects the encoding itself, honouring the page's <meta charset>.
+    """
+    names = []
+    if charset:
+        names.append(charset)
+        with suppress(LookupError):
+            names.append(codecs.lookup(charset).name)
+    for name in names:
         try:
+            return etree.HTMLPullParser(events=('end',), tag='a', encoding=name)
+        except LookupError:
+            continue
+    return etree.HTMLPullParser(events=('end',), tag='a')
+
+async def crawl_page(session, semaphore, source, page):
+    """
+    Streams one listing page into an lxml pull parser, parsing each chunk off the event loop.
+    lxml parsers must stay on the thread that created them, so every page gets its
+    own single-worker executor instead of sharing the default one with other pages.
+    """
+    url = page_url(source, page)
+    loop = asyncio.get_running_loop()
+    executor = ThreadPoolExecutor(max_workers=1)
+    rows = []
+    try:
+        async with semaphore:
             print(f"Attempting to fetch data from: {url}")
-            response = requests.get(url, timeout=30)
-            response.raise_for_status()
-            print(f"Successfully fetched data. HTTP status code: {response.status_code}")
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            items = soup.select(selector)
-            
-            print(f"Found {len(items)} items on the page.")
-            
-            count = 0
-            for item in items:
-                try:
-                    title = get_title(item)
-                    item_url = get_url(item)
-                    
-                    if title and item_url and item_url.startswith('http'):
-                        cursor.execute(
-                            "INSERT OR IGNORE INTO textures (title, url, source) VALUES (?, ?, ?)", 
-                            (title, item_url, source_name)
-                        )
-                        count += 1
-                except Exception as e:
-                    print(f"Failed to process an item from {source_name}: {e}")
-            
-            conn.commit()
-            total_added += count
-            print(f"Indexing complete for {source_name}. Added {count} new entries.")
+            async with session.get(url, timeout=aiohttp.ClientTimeout(total=30)) as response:
+                response.raise_for_status()
+                print(f"Successfully fetched {source.name} page {page}. HTTP status code: {response.status}")
+                parser = await loop.run_in_executor(executor, new_parser, response.charset)
+                async for chunk in response.content.iter_chunked(CHUNK_SIZE):
+                    rows += await loop.run_in_executor(executor, parse_chunk, parser, chunk, source)
+            rows += await loop.run_in_executor(executor, parse_chunk, parser, None, source)
+    finally:
+        executor.shutdown(wait=False)
+
+    print(f"Found {len(rows)} items on {source.name} page {page}.")
+    return rows
+
+def index_crawl_results(pages, results):
+    """Writes the new rows of a finished crawl to the database; runs off the event loop."""
+    conn = sqlite3.connect(DATABASE_FILE, isolation_level=None)
+    cursor = conn.cursor()
+    # URLs already indexed; checking this set is far cheaper than letting
+    # INSERT OR IGNORE probe the UNIQUE index for every re-crawled row.
+    existing = set(r[0] for r in cursor.execute("SELECT url FROM textures"))
 
-        except requests.exceptions.RequestException as e:
-            print(f"Error during crawling {source_name}: A network-related issue occurred. Details: {e}")
-        except Exception as e:
-            print(f"An unexpected error occurred during crawling {source_name}: {e}")
+    rows: list[tuple[str, str, str]] = []
+    any_succeeded = False
+    # URLs found on each source's earlier pages, to spot sources that ignore ?page=N.
+    seen_by_source: dict[str, set[str]] = {}
+    for (source, page), result in zip(pages, results):
+        source_name = f"{source.name} page {page}"
+        if isinstance(result, (aiohttp.ClientError, asyncio.TimeoutError)):
+            print(f"Error during crawling {source_name}: A network-related issue occurred. Details: {result!r}")
+        elif isinstance(result, Exception):
+            print(f"An unexpected error occurred during crawling {source_name}: {result}")
+        else:
+            any_succeeded = True
+            seen = seen_by_source.setdefault(source.name, set())
+            page_urls = {row[1] for row in result}
+            if page > 1 and page_urls and page_urls <= seen:
+                print(f"Warning: {source_name} only repeats earlier pages; {source.name} may not support ?page=N.")
+            seen |= page_urls
+            new_count = 0
+            for row in result:
+                item_url = row[1]
+                if item_url in existing:
+                    continue
+                existing.add(item_url)
+                rows.append(row)
+                new_count += 1
+            print(f"Crawling complete for {source_name}. Found {len(result)} entries, {new_count} new.")
 
+    crawled_at = int(time.time())
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("BEGIN")
+    cursor.executemany(
+        "INSERT OR IGNORE INTO textures (title, url, source, crawled_at) VALUES (?, ?, ?, ?)",
+        [row + (crawled_at,) for row in rows]
+    )
+    # rowcount excludes the FTS trigger writes that conn.total_changes would include.
+    total_added = cursor.rowcount
+    if any_succeeded:
+        # A crawl where every page failed isn't recorded, so the next startup retries it.
+        cursor.execute(
+            "INSERT OR REPLACE INTO crawl_meta (id, last_crawled_at) VALUES (1, ?)",
+            (crawled_at,)
+        )
+    conn.commit()
     conn.close()
     print(f"\nTotal indexing complete. Added {total_added} new entries across all sources.")
 
+async def crawl_and_index_all_sources():
+    """Crawls all defined sources concurrently and populates the database with detailed logging."""
+    print("Starting the crawling and indexing process for all sources...")
+
+    # This runs as a background task, so failures are logged here rather than
+    # surfacing from the task at shutdown. Cancellation still propagates.
+    try:
+        # The semaphore caps in-flight requests so paginated sources don't
+        # overwhelm their origin.
+        semaphore = asyncio.Semaphore(CRAWL_CONCURRENCY)
+        pages = [(source, page) for source in SOURCES for page in range(1, source.max_pages + 1)]
+        async with aiohttp.ClientSession() as session:
+            tasks = [crawl_page(session, semaphore, source, page) for source, page in pages]
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, index_crawl_results, pages, results)
+    except Exception as e:
+        print(f"An unexpected error occurred during crawling and indexing: {e!r}")
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
     Handles application startup and shutdown events.
-    The database setup and crawling logic is triggered on startup.
+    The database is set up on startup. If the index is empty or older than
+    CRAWL_TTL, a crawl is started in the background so the server can begin
+    serving immediately; an unfinished crawl is cancelled on shutdown.
     """
     setup_database()
-    crawl_and_index_all_sources()
+    app.state.pool = open_pool()
+
+    crawl_task = None
+    if run_pooled(app.state.pool, index_is_stale):
+        crawl_task = asyncio.create_task(crawl_and_index_all_sources())
+    else:
+        print("Index was crawled recently; skipping the startup crawl.")
+
     yield
-    # You can add cleanup code here if needed.
+
+    if crawl_task is not None:
+        crawl_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await crawl_task
+    close_pool(app.state.pool)
 
 # Initialize FastAPI app with the lifespan handler
 app = FastAPI(lifespan=lifespan)
 
 # Main route for the search form and results
 @app.get("/", response_class=HTMLResponse)
-async def home(request: Request, q: Optional[str] = None):
+async def home(request: Request, q: Optional[str] = None, source: Optional[str] = None):
     """
     Handles the search functionality and displays results.
     - If a search query 'q' is provided, it searches the database.
-    - Otherwise, it displays the first 20 entries.
+    - If 'source' is provided, only results from that source are shown.
+    - Otherwise, it displays the first RESULTS_LIMIT (50) entries.
     """
-    conn = sqlite3.connect(DATABASE_FILE)
-    cursor = conn.cursor()
+    pool = request.app.state.pool
     
     # Determine which query to run based on the search term
-    if q:
-        sanitized_q = f'%{q}%'
-        cursor.execute("SELECT title, url, source FROM textures WHERE title LIKE ? LIMIT 50", (sanitized_q,))
-        results = cursor.fetchall()
-        title = f"Search Results for '{q}'"
+    fts_query = to_fts_query(q) if q else ''
+    if fts_query:
+        if source:
+            # Over-fetch FTS hits so enough survive the source filter.
+            results_html = await run_in_threadpool(
+                run_pooled, pool, render_results, SEARCH_BY_SOURCE_QUERY,
+                (fts_query, RESULTS_LIMIT * 10, source, RESULTS_LIMIT)
+            )
+        else:
+            results_html = await run_in_threadpool(
+                run_pooled, pool, render_results, SEARCH_QUERY, (fts_query, RESULTS_LIMIT)
+            )
+        title = f"Search Results for '{escape(q)}'"
         
-        if not results:
+        if not results_html:
             results_html = "<p class='text-gray-500 mt-4'>No results found.</p>"
-        else:
-            results_html = "<ul class='list-disc pl-5 mt-4 space-y-2'>"
-            for result_title, url, source in results:
-                results_html += f"<li><a href='{url}' target='_blank' class='text-blue-500 hover:underline'>{result_title}</a> <span class='text-xs text-gray-500'>({source})</span></li>"
-            results_html += "</ul>"
             
     else:
-        cursor.execute("SELECT title, url, source FROM textures LIMIT 50")
-        results = cursor.fetchall()
+        if source:
+            results_html = await run_in_threadpool(
+                run_pooled, pool, render_results,
+                "SELECT title, url, source FROM textures WHERE source = ? LIMIT ?",
+                (source, RESULTS_LIMIT)
+            )
+        else:
+            results_html = await run_in_threadpool(
+                run_pooled, pool, render_results, "SELECT title, url, source FROM textures LIMIT ?", (RESULTS_LIMIT,)
+            )
         title = "Featured Resources"
-        
-        results_html = "<ul class='list-disc pl-5 mt-4 space-y-2'>"
-        for result_title, url, source in results:
-            results_html += f"<li><a href='{url}' target='_blank' class='text-blue-500 hover:underline'>{result_title}</a> <span class='text-xs text-gray-500'>({source})</span></li>"
-        results_html += "</ul>"
-        
-    conn.close()
     
-    html_content = f"""
-    <!DOCTYPE html>
-    <html lang="en">
-    <head>
-        <meta charset="UTF-8">
-        <meta name="viewport" content="width=device-width, initial-scale=1.0">
-        <title>Texture Search Engine</title>
-        <script src="https://cdn.tailwindcss.com"></script>
-        <link rel="preconnect" href="https://fonts.googleapis.com">
-        <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
-        <link href="https://fonts.googleapis.com/css2?family=Inter:wght@400;700&display=swap" rel="stylesheet">
-        <style>
-            body {{
-                font-family: 'Inter', sans-serif;
-                background-color: #f3f4f6;
-            }}
-        </style>
-    </head>
-    <body class="bg-gray-100 flex items-center justify-center min-h-screen p-4">
-        <div class="bg-white rounded-xl shadow-lg p-8 w-full max-w-2xl">
-            <h1 class="text-3xl font-bold text-gray-800 mb-6 text-center">Design Resource Search</h1>
-            <form action="/" method="get" class="flex flex-col sm:flex-row gap-4 mb-8">
-                <input type="text" name="q" placeholder="Search for textures, materials..." class="flex-1 p-3 rounded-lg border-2 border-gray-300 focus:outline-none focus:border-blue-500 transition-colors" value="{q if q else ''}">
-                <button type="submit" class="bg-blue-600 text-white font-semibold py-3 px-6 rounded-lg hover:bg-blue-700 transition-colors shadow-md">Search</button>
-            </form>
-            <h2 class="text-2xl font-semibold text-gray-700 mb-4">{title}</h2>
-            {results_html}
-        </div>
-    </body>
-    </html>
-    """
+    html_content = TEMPLATE_HEAD + escape(q or '') + TEMPLATE_MID + title + TEMPLATE_RESULTS + results_html + TEMPLATE_TAIL
     return HTMLResponse(content=html_content)
 
 @app.get("/status")
-async def status():
+async def status(request: Request):
     """
     A simple status page to check if the database has been populated.
     """
-    conn = sqlite3.connect(DATABASE_FILE)
-    cursor = conn.cursor()
-    cursor.execute("SELECT COUNT(*) FROM textures")
-    count = cursor.fetchone()[0]
-    conn.close()
+    rows = await run_in_threadpool(run_pooled, request.app.state.pool, fetch_all, "SELECT COUNT(*) FROM textures")
+    count = rows[0][0]
     return {"status": "ok", "indexed_entries": count}
 
 # To run this app locally, you can use the command:
@@ -1,4 +1,5 @@
 fastapi
 uvicorn
-requests
-beautifulsoup4
+aiohttp
+lxml
+cssselect
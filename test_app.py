@@ -0,0 +1,72 @@
+import asyncio
+
+import app
+
+CARD_COUNT = 3000
+PAGE = (
+    b'<html><head><script>var x = 1;</script></head><body>'
+    b'<nav><a href="/about">About</a></nav><main>'
+    + b''.join(
+        b'<div class="card"><svg><path d="M0"/></svg>'
+        b'<a href="/textures/T%d"><h3>Wood %d</h3></a></div>' % (i, i)
+        for i in range(CARD_COUNT)
+    )
+    + b'</main></body></html>'
+)
+
+
+class FakeContent:
+    async def iter_chunked(self, size):
+        for start in range(0, len(PAGE), size):
+            yield PAGE[start:start + size]
+            await asyncio.sleep(0)
+
+
+class FakeResponse:
+    status = 200
+    charset = None
+    content = FakeContent()
+
+    def raise_for_status(self):
+        pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        pass
+
+
+class FakeSession:
+    def get(self, url, timeout=None):
+        return FakeResponse()
+
+
+def test_crawl_pages_concurrently():
+    """Several pages parsed at once must not share lxml parsers across threads."""
+    source = app.SOURCES[0]
+
+    async def crawl():
+        semaphore = asyncio.Semaphore(app.CRAWL_CONCURRENCY)
+        tasks = [app.crawl_page(FakeSession(), semaphore, source, page) for page in range(1, 9)]
+        return await asyncio.gather(*tasks)
+
+    for _ in range(5):
+        for rows in asyncio.run(crawl()):
+            assert len(rows) == CARD_COUNT
+            assert rows[0] == ('Wood 0', 'https://ambientcg.com/textures/T0', source.name)
+            assert rows[-1][1] == f'https://ambientcg.com/textures/T{CARD_COUNT - 1}'
+
+
+def test_parser_encoding_fallbacks():
+    """Header charsets lxml doesn't know by name must not lose the page."""
+    source = app.SOURCES[0]
+    latin_page = (
+        '<html><head><meta charset="iso-8859-1"></head><body>'
+        '<a href="/textures/Cafe"><h3>Caf\xe9</h3></a></body></html>'
+    ).encode('latin-1')
+
+    for charset in ('latin-1', 'not-a-charset', None):
+        parser = app.new_parser(charset)
+        rows = app.parse_chunk(parser, latin_page, source) + app.parse_chunk(parser, None, source)
+        assert rows == [('Caf\xe9', 'https://ambientcg.com/textures/Cafe', source.name)]
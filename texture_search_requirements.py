@@ -1,4 +0,0 @@
-fastapi
-uvicorn
-requests
-beautifulsoup4